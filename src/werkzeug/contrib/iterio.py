@@ -40,8 +40,11 @@ r"""
     :license: BSD-3-Clause
 """
 import warnings
+from bisect import bisect_right
+from collections import deque
 
 from .._compat import implements_iterator
+from .._internal import _missing
 
 try:
     import greenlet
@@ -65,6 +68,12 @@ def _mixed_join(iterable, sentinel):
     return first_item + u"".join(iterator)
 
 
+def _raise_closed():
+    """Shared raise path so the guard inlined into each stream method
+    stays a cheap attribute check and branch."""
+    raise ValueError("I/O operation on closed file")
+
+
 def _newline(reference_string):
     if isinstance(reference_string, bytes):
         return b"\n"
@@ -95,68 +104,83 @@ class IterIO(object):
     otherwise the end of the stream is marked with the wrong sentinel
     value.
 
+    Read streams keep everything read so far buffered so that seeking
+    backwards works.  Pass ``seekable=False`` for forward-only reading
+    of a large iterable; consumed data is then discarded and seeking
+    back behind it raises an :exc:`IOError`.
+
     .. versionadded:: 0.9
        `sentinel` parameter was added.
+
+    .. versionadded:: 0.16
+       `seekable` parameter was added.
     """
 
-    def __new__(cls, obj, sentinel=""):
+    __slots__ = ()
+
+    def __new__(cls, obj, sentinel="", seekable=True):
         try:
             iterator = iter(obj)
         except TypeError:
             return IterI(obj, sentinel)
-        return IterO(iterator, sentinel)
+        return IterO(iterator, sentinel, seekable)
 
     def __iter__(self):
         return self
 
     def tell(self):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         return self.pos
 
     def isatty(self):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         return False
 
     def seek(self, pos, mode=0):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         raise IOError(9, "Bad file descriptor")
 
     def truncate(self, size=None):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         raise IOError(9, "Bad file descriptor")
 
     def write(self, s):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         raise IOError(9, "Bad file descriptor")
 
-    def writelines(self, list):
+    def writelines(self, lines):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         raise IOError(9, "Bad file descriptor")
 
     def read(self, n=-1):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         raise IOError(9, "Bad file descriptor")
 
     def readlines(self, sizehint=0):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
+        raise IOError(9, "Bad file descriptor")
+
+    def readinto(self, b):
+        if self.closed:
+            _raise_closed()
         raise IOError(9, "Bad file descriptor")
 
     def readline(self, length=None):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         raise IOError(9, "Bad file descriptor")
 
     def flush(self):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         raise IOError(9, "Bad file descriptor")
 
     def __next__(self):
@@ -169,17 +193,37 @@ class IterIO(object):
 
 
 class IterI(IterIO):
-    """Convert an stream into an iterator."""
+    """Convert an stream into an iterator.
+
+    With greenlet available the writer function is executed step by
+    step, suspended on every flush.  Without greenlet the function runs
+    to completion on the first iteration step and the flushed items are
+    buffered in a deque and yielded lazily, so only writers that rely
+    on interleaved execution (e.g. infinite producers) need greenlet.
+    """
+
+    __slots__ = ("_parent", "_queue", "_buffer", "closed", "sentinel", "pos")
 
     def __new__(cls, func, sentinel=""):
         if greenlet is None:
-            raise RuntimeError("IterI requires greenlet support")
+            return cls._iter_blocking(func, sentinel)
+        return cls._iter_greenlet(func, sentinel)
+
+    @classmethod
+    def _new_stream(cls, sentinel):
         stream = object.__new__(cls)
-        stream._parent = greenlet.getcurrent()
+        stream._parent = None
+        stream._queue = None
         stream._buffer = []
         stream.closed = False
         stream.sentinel = sentinel
         stream.pos = 0
+        return stream
+
+    @classmethod
+    def _iter_greenlet(cls, func, sentinel):
+        stream = cls._new_stream(sentinel)
+        stream._parent = greenlet.getcurrent()
 
         def run():
             func(stream)
@@ -192,6 +236,15 @@ class IterI(IterIO):
                 return
             yield rv[0]
 
+    @classmethod
+    def _iter_blocking(cls, func, sentinel):
+        stream = cls._new_stream(sentinel)
+        stream._queue = queue = deque()
+        func(stream)
+        stream.close()
+        while queue:
+            yield queue.popleft()
+
     def close(self):
         if not self.closed:
             self.closed = True
@@ -199,36 +252,77 @@ class IterI(IterIO):
 
     def write(self, s):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         if s:
             self.pos += len(s)
             self._buffer.append(s)
 
-    def writelines(self, list):
-        for item in list:
+    def writelines(self, lines):
+        for item in lines:
             self.write(item)
 
     def flush(self):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         self._flush_impl()
 
     def _flush_impl(self):
         data = _mixed_join(self._buffer, self.sentinel)
         self._buffer = []
-        if not data and self.closed:
+        if self._parent is None:
+            if data or not self.closed:
+                self._queue.append(data)
+        elif not data and self.closed:
             self._parent.switch()
         else:
             self._parent.switch((data,))
 
 
 class IterO(IterIO):
-    """Iter output.  Wrap an iterator and give it a stream like interface."""
+    """Iter output.  Wrap an iterator and give it a stream like interface.
+
+    The data pulled from the iterator is buffered as a list of chunks
+    instead of one monolithic string, so reading never re-concatenates
+    (and re-copies) everything read so far.
+
+    ``_min_read`` is the minimum number of bytes :meth:`read` pulls
+    from the wrapped iterator once it has to visit it at all; excess
+    stays buffered for later calls.  The default of 0 keeps pulls as
+    lazy as the caller's reads.  Raising it on an instance (e.g. to
+    ``io.DEFAULT_BUFFER_SIZE``) amortizes the per-chunk resume cost of
+    generators that yield very small fragments.
+    """
 
-    def __new__(cls, gen, sentinel=""):
+    __slots__ = (
+        "_gen",
+        "_min_read",
+        "_chunks",
+        "_starts",
+        "_chunks_len",
+        "_nl_free_from",
+        "_nl_free_to",
+        "_nl",
+        "_seekable",
+        "_intern",
+        "closed",
+        "sentinel",
+        "pos",
+    )
+
+    def __new__(cls, gen, sentinel="", seekable=True):
         self = object.__new__(cls)
         self._gen = gen
-        self._buf = None
+        self._min_read = 0
+        self._seekable = seekable
+        self._chunks = []
+        self._starts = []
+        self._chunks_len = 0
+        # buffered range [_nl_free_from, _nl_free_to) known to contain
+        # no newline; chunks never change, so this stays valid forever
+        self._nl_free_from = 0
+        self._nl_free_to = 0
+        self._nl = None
+        self._intern = {}
         self.sentinel = sentinel
         self.closed = False
         self.pos = 0
@@ -237,113 +331,272 @@ class IterO(IterIO):
     def __iter__(self):
         return self
 
-    def _buf_append(self, string):
-        """Replace string directly without appending to an empty string,
-        avoiding type issues."""
-        if not self._buf:
-            self._buf = string
-        else:
-            self._buf += string
+    @property
+    def _buf(self):
+        """All buffered data joined into one string, or `None` if no
+        chunk was pulled yet.  Kept for introspection; internally the
+        buffer stays a list of chunks.
+        """
+        if not self._chunks:
+            return None
+        return _mixed_join(self._chunks, self.sentinel)
+
+    def _append(self, chunk):
+        """Add a chunk pulled from the generator to the buffer."""
+        if self._nl is None:
+            # the string type is fixed for the lifetime of the stream,
+            # so resolve the newline delimiter once instead of per scan
+            self._nl = _newline(chunk)
+        chunks = self._chunks
+        if chunks and len(chunk) < 512:
+            if not chunk:
+                return
+            if len(chunks[-1]) + len(chunk) <= 4096:
+                # generators that yield a few bytes at a time would
+                # otherwise store one object header per fragment; fold
+                # small chunks into the previous one instead.  The 4096
+                # cap bounds how often a growing chunk is re-copied.
+                chunks[-1] = chunks[-1] + chunk
+                self._chunks_len += len(chunk)
+                return
+        if len(chunk) <= 64:
+            # deduplicate small repeated chunks (delimiters, boundary
+            # markers) so only one copy of each is kept alive
+            intern = self._intern
+            if len(intern) < 256:
+                chunk = intern.setdefault(chunk, chunk)
+            else:
+                chunk = intern.get(chunk, chunk)
+        self._starts.append(self._chunks_len)
+        self._chunks.append(chunk)
+        self._chunks_len += len(chunk)
+
+    def _discard_consumed(self):
+        """Drop chunks that lie entirely before the current position.
+        Only called for unseekable streams; the last chunk is always
+        kept so the stream remembers its string type.
+        """
+        chunks = self._chunks
+        starts = self._starts
+        while len(chunks) > 1 and starts[1] <= self.pos:
+            del chunks[0]
+            del starts[0]
+
+    def _chunk_index(self, pos):
+        """The index of the buffered chunk that contains ``pos``."""
+        index = bisect_right(self._starts, pos) - 1
+        return index if index > 0 else 0
+
+    def _join_buffered(self, start, end):
+        """Join the buffered range ``start:end`` into a single string,
+        touching only the chunks that overlap it.
+        """
+        chunks = self._chunks
+        starts = self._starts
+        index = self._chunk_index(start)
+        result = []
+        while index < len(chunks) and starts[index] < end:
+            chunk_start = starts[index]
+            result.append(
+                chunks[index][max(0, start - chunk_start) : end - chunk_start]
+            )
+            index += 1
+        if not result:
+            return chunks[-1][:0] if chunks else self.sentinel
+        return _mixed_join(result, self.sentinel)
+
+    def _find_newline(self, start):
+        """Find the absolute position of the next newline in the
+        buffered data at or after ``start``, or -1 if there is none.
+        Ranges already scanned without a hit are remembered and never
+        scanned again.
+        """
+        scan_from = start
+        if self._nl_free_from <= start < self._nl_free_to:
+            scan_from = self._nl_free_to
+        chunks = self._chunks
+        starts = self._starts
+        newline = self._nl
+        index = self._chunk_index(scan_from)
+        while index < len(chunks):
+            chunk = chunks[index]
+            offset = scan_from - starts[index]
+            local_pos = chunk.find(newline, offset if offset > 0 else 0)
+            if local_pos >= 0:
+                return starts[index] + local_pos
+            index += 1
+        self._nl_free_from = start
+        self._nl_free_to = self._chunks_len
+        return -1
 
     def close(self):
         if not self.closed:
             self.closed = True
+            self._intern.clear()
             if hasattr(self._gen, "close"):
                 self._gen.close()
 
     def seek(self, pos, mode=0):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         if mode == 1:
             pos += self.pos
         elif mode == 2:
             self.read()
-            self.pos = min(self.pos, self.pos + pos)
-            return
+            pos = min(self.pos, self.pos + pos)
         elif mode != 0:
             raise IOError("Invalid argument")
-        buf = []
-        try:
-            tmp_end_pos = len(self._buf or "")
-            while pos > tmp_end_pos:
-                item = next(self._gen)
-                tmp_end_pos += len(item)
-                buf.append(item)
-        except StopIteration:
-            pass
-        if buf:
-            self._buf_append(_mixed_join(buf, self.sentinel))
-        self.pos = max(0, pos)
+        while pos > self._chunks_len:
+            item = next(self._gen, _missing)
+            if item is _missing:
+                break
+            self._append(item)
+        pos = max(0, pos)
+        if not self._seekable and self._starts and pos < self._starts[0]:
+            raise IOError("cannot seek back on unseekable stream")
+        self.pos = pos
+        if not self._seekable:
+            self._discard_consumed()
 
     def read(self, n=-1):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
         if n < 0:
-            self._buf_append(_mixed_join(self._gen, self.sentinel))
-            result = self._buf[self.pos :]
+            # drain the generator chunk by chunk; joining it first would
+            # copy the remainder once just to copy it again below
+            for item in self._gen:
+                self._append(item)
+            if not self._chunks:
+                return self.sentinel
+            result = self._join_buffered(self.pos, self._chunks_len)
             self.pos += len(result)
+            if not self._seekable:
+                self._discard_consumed()
             return result
         new_pos = self.pos + n
-        buf = []
-        try:
-            tmp_end_pos = 0 if self._buf is None else len(self._buf)
-            while new_pos > tmp_end_pos or (self._buf is None and not buf):
-                item = next(self._gen)
-                tmp_end_pos += len(item)
-                buf.append(item)
-        except StopIteration:
-            pass
-        if buf:
-            self._buf_append(_mixed_join(buf, self.sentinel))
-
-        if self._buf is None:
+        if new_pos <= self._chunks_len and self._chunks:
+            # fast path: everything requested is buffered already, no
+            # generator interaction and no pull-loop scaffolding needed
+            try:
+                return self._join_buffered(self.pos, new_pos)
+            finally:
+                self.pos = new_pos
+                if not self._seekable:
+                    self._discard_consumed()
+
+        # once the iterator has to be visited anyway, optionally read
+        # ahead so tiny-chunk generators are not resumed once per small
+        # read
+        target = max(new_pos, self.pos + self._min_read)
+        pulled = False
+        while target > self._chunks_len or (not self._chunks and not pulled):
+            item = next(self._gen, _missing)
+            if item is _missing:
+                break
+            self._append(item)
+            pulled = True
+
+        if not self._chunks:
             return self.sentinel
 
-        new_pos = max(0, new_pos)
         try:
-            return self._buf[self.pos : new_pos]
+            return self._join_buffered(self.pos, new_pos)
         finally:
-            self.pos = min(new_pos, len(self._buf))
+            self.pos = min(new_pos, self._chunks_len)
+            if not self._seekable:
+                self._discard_consumed()
+
+    def readinto(self, b):
+        """Read up to ``len(b)`` bytes into the writable buffer ``b``
+        and return the number of bytes read.  Buffered chunks are
+        copied straight into the target through memoryviews instead of
+        being joined into an intermediate string first.  Only supported
+        for byte streams.
+        """
+        if self.closed:
+            _raise_closed()
+        target = memoryview(b)
+        n = len(target)
+        while self._chunks_len - self.pos < n:
+            item = next(self._gen, _missing)
+            if item is _missing:
+                break
+            self._append(item)
+        chunks = self._chunks
+        starts = self._starts
+        index = self._chunk_index(self.pos)
+        filled = 0
+        while filled < n and index < len(chunks):
+            chunk = chunks[index]
+            offset = self.pos + filled - starts[index]
+            take = min(n - filled, len(chunk) - offset)
+            if take > 0:
+                target[filled : filled + take] = memoryview(chunk)[
+                    offset : offset + take
+                ]
+                filled += take
+            index += 1
+        self.pos += filled
+        if not self._seekable:
+            self._discard_consumed()
+        return filled
 
     def readline(self, length=None):
         if self.closed:
-            raise ValueError("I/O operation on closed file")
+            _raise_closed()
 
         nl_pos = -1
-        if self._buf:
-            nl_pos = self._buf.find(_newline(self._buf), self.pos)
-        buf = []
-        try:
-            if self._buf is None:
-                pos = self.pos
-            else:
-                pos = len(self._buf)
-            while nl_pos < 0:
-                item = next(self._gen)
-                local_pos = item.find(_newline(item))
-                buf.append(item)
-                if local_pos >= 0:
-                    nl_pos = pos + local_pos
-                    break
-                pos += len(item)
-        except StopIteration:
-            pass
-        if buf:
-            self._buf_append(_mixed_join(buf, self.sentinel))
-
-        if self._buf is None:
+        if self._chunks:
+            nl_pos = self._find_newline(self.pos)
+        if nl_pos >= 0:
+            # fast path: the line is buffered in full, skip the pull
+            # loop and its exception scaffolding entirely
+            return self._slice_line(nl_pos, length)
+        # bytes.find/str.find run the scan itself in C (memchr), so
+        # per chunk only the loop overhead is interpreted; keep that
+        # low with local bindings instead of joining chunks into one
+        # big string first, which would copy data we already buffer
+        pos = self._chunks_len
+        gen = self._gen
+        append = self._append
+        newline = self._nl
+        while nl_pos < 0:
+            item = next(gen, _missing)
+            if item is _missing:
+                break
+            append(item)
+            if newline is None:
+                newline = self._nl
+            local_pos = item.find(newline)
+            if local_pos >= 0:
+                nl_pos = pos + local_pos
+                break
+            pos += len(item)
+        if nl_pos < 0:
+            # everything from the current position on was scanned
+            self._nl_free_from = self.pos
+            self._nl_free_to = self._chunks_len
+
+        if not self._chunks:
             return self.sentinel
+        return self._slice_line(nl_pos, length)
 
+    def _slice_line(self, nl_pos, length):
+        """Return the buffered line ending at the newline at ``nl_pos``
+        (or the rest of the buffer if negative), capped at ``length``.
+        """
         if nl_pos < 0:
-            new_pos = len(self._buf)
+            new_pos = self._chunks_len
         else:
             new_pos = nl_pos + 1
         if length is not None and self.pos + length < new_pos:
             new_pos = self.pos + length
         try:
-            return self._buf[self.pos : new_pos]
+            return self._join_buffered(self.pos, new_pos)
         finally:
-            self.pos = min(new_pos, len(self._buf))
+            self.pos = min(new_pos, self._chunks_len)
+            if not self._seekable:
+                self._discard_consumed()
 
     def readlines(self, sizehint=0):
         total = 0
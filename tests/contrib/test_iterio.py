@@ -11,6 +11,7 @@
 import pytest
 
 from .. import strict_eq
+from werkzeug.contrib import iterio
 from werkzeug.contrib.iterio import greenlet
 from werkzeug.contrib.iterio import IterIO
 
@@ -123,6 +124,51 @@ class TestIterO(object):
         io.close()
         pytest.raises(ValueError, io.read)
 
+    def test_seekable_false(self):
+        io = IterIO((b"x" * 600 for _ in range(10)), b"", seekable=False)
+        assert io.read(1200) == b"x" * 1200
+        assert len(io._chunks) == 1
+        assert io.read() == b"x" * 4800
+        assert io.tell() == 6000
+        # the last chunk is retained, anything before it is discarded
+        io.seek(5400)
+        assert io.read() == b"x" * 600
+        pytest.raises(IOError, io.seek, 5399)
+        io.seek(0, 2)
+        assert io.tell() == 6000
+        pytest.raises(IOError, io.seek, -6000, 2)
+
+    def test_seekable_default(self):
+        io = IterIO((b"x" * 600 for _ in range(10)), b"")
+        assert io.read() == b"x" * 6000
+        io.seek(0)
+        assert io.read(600) == b"x" * 600
+
+    def test_readinto(self):
+        io = IterIO([b"a" * 600, b"b" * 600], b"")
+        buf = bytearray(700)
+        assert io.readinto(buf) == 700
+        assert bytes(buf) == b"a" * 600 + b"b" * 100
+        assert io.tell() == 700
+        buf = bytearray(700)
+        assert io.readinto(buf) == 500
+        assert bytes(buf[:500]) == b"b" * 500
+        assert io.readinto(bytearray(10)) == 0
+        io.close()
+        pytest.raises(ValueError, io.readinto, bytearray(10))
+
+    def test_readinto_after_read(self):
+        io = IterIO([b"Hello", b"World"], b"")
+        assert io.read(3) == b"Hel"
+        buf = bytearray(4)
+        assert io.readinto(buf) == 4
+        assert bytes(buf) == b"loWo"
+        assert io.read() == b"rld"
+
+    def test_readinto_requires_bytes(self):
+        io = IterIO([u"Hello"])
+        pytest.raises(TypeError, io.readinto, bytearray(4))
+
     def test_sentinel_cases(self):
         io = IterIO([])
         strict_eq(io.read(), "")
@@ -153,7 +199,6 @@ class TestIterO(object):
         strict_eq(io.readline(), u"")
 
 
-@pytest.mark.skipif(greenlet is None, reason="Greenlet is not installed.")
 class TestIterI(object):
     def test_basic(self):
         def producer(out):
@@ -184,3 +229,36 @@ class TestIterI(object):
         strict_eq(next(iterable), b"")
         iterable = IterIO(producer_dummy_flush, u"")
         strict_eq(next(iterable), u"")
+
+
+class TestIterIWithoutGreenlet(TestIterI):
+    """Runs the same scenarios through the eager deque fallback that is
+    used when greenlet is not installed.
+    """
+
+    @pytest.fixture(autouse=True)
+    def disable_greenlet(self, monkeypatch):
+        monkeypatch.setattr(iterio, "greenlet", None)
+
+
+@pytest.mark.skipif(greenlet is None, reason="Greenlet is not installed.")
+class TestIterIGreenlet(object):
+    def test_interleaved_execution(self):
+        # only with greenlet is the producer suspended between flushes;
+        # the fallback runs it to completion on the first iteration step
+        steps = []
+
+        def producer(out):
+            steps.append("first")
+            out.write("1")
+            out.flush()
+            steps.append("second")
+            out.write("2")
+
+        iterable = IterIO(producer)
+        assert steps == []
+        assert next(iterable) == "1"
+        assert steps == ["first"]
+        assert next(iterable) == "2"
+        assert steps == ["first", "second"]
+        pytest.raises(StopIteration, next, iterable)